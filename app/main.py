@@ -1,29 +1,24 @@
 #Python
-from typing import List, Optional
-from enum import Enum
+from typing import Literal, Optional
 
 #Pydantic
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 from pydantic import Field
 
 #FastAPI
 from fastapi import FastAPI
 from fastapi import HTTPException
 from fastapi import Body, Query, Path, Form, Header, Cookie, File, UploadFile
+from fastapi.responses import ORJSONResponse, Response
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse) # orjson serializa las respuestas más rápido que el json estándar
 
 
     # ------------------------- #
     ## Models for the API endpoints (pydantic) ##
     # ------------------------- #
 
-class HairColor(Enum): 
-    white = "white"
-    brown = "brown"
-    black = "black"
-    blonde = "blonde"
-    red = "red"
+HairColor = Literal["white", "brown", "black", "blonde", "red"] # Literal en vez de Enum: se valida como string, sin crear un miembro del Enum
 
 class Location(BaseModel): 
     city: str
@@ -36,29 +31,29 @@ class PersonBase(BaseModel):
         ..., 
         min_length=1,
         max_length=50,
-        example="Miguel" #example field for testing
+        examples=["Miguel"] #example field for testing
         )
     last_name: str = Field(
         ..., 
         min_length=1,
         max_length=50,
-        example="Torres"
+        examples=["Torres"]
         )
     age: int = Field(
         ...,
         gt=0,
         le=115,
-        example=25
+        examples=[25]
     )
-    hair_color: Optional[HairColor] = Field(default=None, example=HairColor.black)
-    is_married: Optional[bool] = Field(default=None, example=False)
+    hair_color: Optional[HairColor] = Field(default=None, examples=["black"])
+    is_married: Optional[bool] = Field(default=None, examples=[False])
 
 class Person(PersonBase): # Password es lo único que no hereda de PersonBase.
     password: str = Field(..., min_length=8)
 
 """
-class Config:  # example of config for pydantic to validate the model
-    schema_extra = {
+model_config = {  # example of config for pydantic to validate the model
+    "json_schema_extra": {
         "example": {
             "first_name": "Facundo",
             "last_name": "Garcia Martoni",
@@ -67,15 +62,21 @@ class Config:  # example of config for pydantic to validate the model
             "is_married": False
         }
     }
+}
 """
 
     #Ejemplo 1 - Output Model Person
 class PersonOut(PersonBase): # Solo hereda de PersonBase.
     pass
 
+# Campos de Person que no están en PersonOut (el password). Se calcula una sola vez y se reutiliza al serializar las respuestas.
+person_out_exclude = frozenset(Person.model_fields.keys() - PersonOut.model_fields.keys())
+
+login_message = 'Succesfully Logged'
+
 class LoginOut(BaseModel): # Solo retornará el username ###y el token?)
-    username: str = Field(..., min_length=1, max_length=20, example="JhonDoe98")
-    message: str = 'Succesfully Logged'
+    username: str = Field(..., min_length=1, max_length=20, examples=["JhonDoe98"])
+    message: str = login_message
 
 
     ##Path Parameters are always required!##
@@ -83,6 +84,8 @@ class LoginOut(BaseModel): # Solo retornará el username ###y el token?)
     # Request and Response Body (FastAPI)
     # --------------------------------- #
 
+home_response = Response(content=b'{"Hello":"World"}', media_type="application/json") # la respuesta siempre es la misma, se serializa una sola vez
+
 @app.get(
     path = "/",
     status_code = 200,
@@ -98,7 +101,7 @@ def home():
     Returns:
         Returns a dictionary with the key "Hello" and the value "World"
     """
-    return {"Hello": "World"}
+    return home_response
 
 """
     # Ejemplo 2 - Output Model Person (This can be used as a quick shortcut if you have only one Pydantic model and want to remove some data from the output.)
@@ -112,7 +115,7 @@ def create_person(person: Person = Body(...)):
         # response_model is the model that will be returned in the response body.
 @app.post(
     path = "/person/new",
-    response_model = PersonOut,
+    responses = {201: {"model": PersonOut}}, # solo para la documentación, la respuesta se arma a mano y no se revalida.
     status_code = 201, # status 201 significa que se creó un nuevo recurso
     tags = ["Persons"], # tags are used to group endpoints in the documentation.
     summary = "Creates a new person in the system"
@@ -134,7 +137,8 @@ def create_person(
         - A newly created person withouth the password.
         - **person: PersonOut** => A *person model* that contains *first_name*, *last_name*, *age*, *hair_color* and *is_married*
     """
-    return person
+    # model_dump_json genera los bytes del JSON directamente desde pydantic-core, sin pasar por un dict intermedio ni validar contra PersonOut
+    return Response(person.model_dump_json(exclude=person_out_exclude), media_type="application/json", status_code=201)
 
 
     # --------------------------------- #
@@ -143,25 +147,24 @@ def create_person(
 
 @app.get(
     path = "/person/detail",
-    response_model = PersonOut,
     status_code = 200, # status code 200 significa que se obtuvo un recurso
     tags = ["Persons"],
     deprecated=True # deprecated is used to mark an endpoint as deprecated.
     )
-def show_person(
+def show_person_by_query(
     name: Optional[str] = Query(
         None,
         min_length = 1, 
         max_length = 50,
         title = "Person Name",
         description = "This is the person name. It's between 1 and 50 characters.",
-        example = "Marge"
+        examples = ["Marge"]
         ),
     age: str = Query(
         ...,
         title = "Person Age",
         description = "This is the person age. It's required.",
-        example = 25
+        examples = [25]
         )
 ): 
     return {name: age}
@@ -171,20 +174,19 @@ def show_person(
     # Validaciones: Path Parameters (FastAPI)
     # --------------------------------- #
 
-persons = [1, 2, 3, 4, 5] # Lista de personas
+persons = frozenset({1, 2, 3, 4, 5}) # Conjunto de ids de personas: buscar un id es O(1), no hay que recorrer una lista
 
 @app.get(
     path = "/person/detail/{person_id}",
-    response_model = PersonOut,
     status_code = 200,
     tags = ["Persons"],
     summary = "Shows a person detail"
     )
-def show_person(
+def show_person_by_id(
     person_id: int = Path(
         ..., 
         gt = 0,
-        example = 123
+        examples = [123]
         )
 ):  # Si se ingresa un id que no existe, retornará una http exception con status code 404 (Not Found) y el mensaje de error.
     if person_id not in persons:
@@ -198,7 +200,7 @@ def show_person(
 
 @app.put(
     path = "/person/{person_id}",
-    response_model=PersonOut,
+    responses = {202: {"model": PersonOut}},
     status_code = 202, # status code 202 significa que se actualizó un recurso
     tags = ["Persons"],
     summary="Updates a person in the system"
@@ -209,7 +211,7 @@ def update_person(
         title = "Person ID",
         description = "This is the person ID. It's required.",
         gt = 0,
-        example = 38472
+        examples = [38472]
     ),
     person: Person = Body(...),
     #location: Location = Body(...)
@@ -217,7 +219,7 @@ def update_person(
     #results = person.dict()
     #results.update(location.dict())
     #return results
-    return person
+    return Response(person.model_dump_json(exclude=person_out_exclude), media_type="application/json", status_code=202)
 
 
     # --------------------------------- #
@@ -226,13 +228,13 @@ def update_person(
 
 @app.post(
     path = "/login",
-    response_model = LoginOut,
+    responses = {200: {"model": LoginOut}}, # solo para la documentación, la respuesta se serializa en la función.
     status_code = 200,
     tags = ["Login"],
     summary = "Log in to the system"
 )
 def login( #campos de formulario que vendrán del frontend.
-    username: str = Form(...),
+    username: str = Form(..., min_length = 1, max_length = 20), # mismas restricciones que LoginOut.username
     password: str = Form(...)
     ):
     """
@@ -246,10 +248,10 @@ def login( #campos de formulario que vendrán del frontend.
             - **password: str** => The password of the user.
         
         Returns:
-        - LoginOut(username = username) => A *login model* that contains *username*, message and *(soon)* a *token*.
-        It has the variables on it to return the data as a dictionary.
+        - A dictionary with the shape of LoginOut => A *login model* that contains *username*, message and *(soon)* a *token*.
     """
-    return LoginOut(username = username) # la clase a retornar es LoginOut y esta al crear el objeto lo convierte a JSON.
+    # No se crea un objeto LoginOut por request: username ya viene validado por Form(...) y el dict se serializa directo con orjson.
+    return ORJSONResponse({"username": username, "message": login_message})
 
 
     # --------------------------------- #
@@ -267,17 +269,18 @@ def contact(
         ...,
         max_length = 20,
         min_length = 3,
-        example = "Miguel"
+        examples = ["Miguel"]
     ),
     last_name: str = Form(
         ...,
         max_length = 20,
         min_length = 3,
-        example = "Torres"
+        examples = ["Torres"]
     ),
-    email: EmailStr = Form(
+    email: str = Form(
         ...,
-        example = "example@example.cl"
+        pattern = r"^[^@\s]+@[^@\s]+\.[^@\s]+$", # chequeo de sintaxis con un regex compilado una sola vez, en vez de email-validator en cada request
+        examples = ["example@example.cl"]
     ),
     message: str = Form(
         ...,
@@ -301,7 +304,7 @@ def contact(
     tags = ["Files"],
     summary = "Uploads an image"
 )
-def post_image(
+async def post_image( # async para no ocupar un hilo del threadpool mientras llegan otras subidas
     image: UploadFile = File(...)
 ):
     """
@@ -317,11 +320,12 @@ def post_image(
         - dict: A dictionary with the image's information. The image's name, content type and the image's size
 
     """
+    size = image.size # tamaño en bytes que ya calculó el parser de multipart, sin leer ni mover el cursor del archivo
     return {
         "File name": image.filename, # nombre del archivo
         "Content type": image.content_type, # content_type es el tipo de archivo que se subió
-        "Size (mb)": round(len(image.file.read())/(1024*1024), ndigits = 2) # len(image.file.read()) es el tamaño en bytes y se divide en 1024*1024 para obtener el tamaño en megabytes
-        #"Size (kb)": round(len(image.file.read())/1024, ndigits = 2) # len(image.file.read()) es el tamaño en bytes y se divide por 1024 para obtener el tamaño en kilobytes
+        "Size (mb)": round(size/(1024*1024), ndigits = 2) # size es el tamaño en bytes y se divide en 1024*1024 para obtener el tamaño en megabytes
+        #"Size (kb)": round(size/1024, ndigits = 2) # size es el tamaño en bytes y se divide por 1024 para obtener el tamaño en kilobytes
     }
 
 """
@@ -330,7 +334,7 @@ def post_image(
     status_code=200
 )
 def upload_images(
-    images: List[UploadFile] = File(...)
+    images: list[UploadFile] = File(...)
 ):
     info_images = [{
         "File Name": image.filename,